@@ -8,8 +8,10 @@ def cir_calibration(market_data: Dict[str, Any], model: Any) -> None:
     """
     Calibrate CIR Model using Generalized Method of Moments (GMM).
     """
-    rates = market_data.get('rates', [])
+    rates = np.asarray(market_data.get('rates', []), dtype=np.float64)
     dt = market_data.get('dt', 1.0)
+    previous_rates = rates[:-1]
+    rate_changes = np.diff(rates)
 
     def objective(params):
         mean_reversion, long_term_mean, volatility = params
@@ -17,13 +19,10 @@ def cir_calibration(market_data: Dict[str, Any], model: Any) -> None:
         model.long_term_mean = long_term_mean
         model.volatility = volatility
 
-        errors = []
-        for i in range(1, len(rates)):
-            drift = mean_reversion * (long_term_mean - rates[i-1]) * dt
-            variance = volatility ** 2 * rates[i-1] * dt
-            moment_error = (rates[i] - rates[i-1] - drift) ** 2 - variance
-            errors.append(moment_error ** 2)
-        return sum(errors)
+        drift = mean_reversion * (long_term_mean - previous_rates) * dt
+        variance = volatility ** 2 * previous_rates * dt
+        moment_errors = (rate_changes - drift) ** 2 - variance
+        return np.sum(moment_errors ** 2)
 
     initial_params = [model.mean_reversion, model.long_term_mean, model.volatility]
     result = minimize(objective, initial_params, method='BFGS')
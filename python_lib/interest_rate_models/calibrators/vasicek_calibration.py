@@ -8,19 +8,19 @@ def vasicek_calibration(market_data: Dict[str, Any], model: Any) -> None:
     """
     Calibrate Vasicek Model using Maximum Likelihood Estimation (MLE).
     """
-    rates = market_data.get('rates', [])
+    rates = np.asarray(market_data.get('rates', []), dtype=np.float64)
     dt = market_data.get('dt', 1.0)
+    previous_rates = rates[:-1]
+    rate_changes = np.diff(rates)
 
     def log_likelihood(params):
         mean_reversion, long_term_mean, volatility = params
         model.mean_reversion = mean_reversion
         model.long_term_mean = long_term_mean
         model.volatility = volatility
-        log_likelihood_sum = 0.0
-        for i in range(1, len(rates)):
-            drift = mean_reversion * (long_term_mean - rates[i-1]) * dt
-            variance = volatility ** 2 * dt
-            log_likelihood_sum += -0.5 * ((rates[i] - rates[i-1] - drift) ** 2 / variance + np.log(variance))
+        drift = mean_reversion * (long_term_mean - previous_rates) * dt
+        variance = volatility ** 2 * dt
+        log_likelihood_sum = np.sum(-0.5 * ((rate_changes - drift) ** 2 / variance + np.log(variance)))
         return -log_likelihood_sum
 
     initial_params = [model.mean_reversion, model.long_term_mean, model.volatility]
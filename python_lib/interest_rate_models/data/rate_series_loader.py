@@ -0,0 +1,216 @@
+# Historical Rate Series Loader
+
+import os
+from itertools import islice
+import numpy as np
+from typing import Dict, Any, List, Optional
+
+# Series are stored one per row, (series x dates), so a single series is contiguous.
+# Columns are named '<CURRENCY>_<TENOR>', e.g. 'USD_10Y'.
+
+
+def _select_columns(columns: List[str], tenors: Optional[List[str]] = None,
+                    currencies: Optional[List[str]] = None) -> List[int]:
+    """
+    Indices of the columns matching the tenor and currency selection.
+    """
+    indices = []
+    for i, column in enumerate(columns):
+        currency, _, tenor = column.partition('_')
+        if tenors is not None and tenor not in tenors:
+            continue
+        if currencies is not None and currency not in currencies:
+            continue
+        indices.append(i)
+    if not indices:
+        raise ValueError(f"No series match tenors={tenors} currencies={currencies}")
+    return indices
+
+
+def _index(indices: List[int]) -> Any:
+    """
+    Use a slice for consecutive indices so the selection stays a view.
+    """
+    if indices == list(range(indices[0], indices[-1] + 1)):
+        return slice(indices[0], indices[-1] + 1)
+    return indices
+
+
+def _date_window(dates: np.ndarray, start: Optional[str] = None, end: Optional[str] = None) -> slice:
+    """
+    Slice of the sorted dates within [start, end].
+    """
+    lo = np.searchsorted(dates, np.datetime64(start, 'D'), side='left') if start is not None else 0
+    hi = np.searchsorted(dates, np.datetime64(end, 'D'), side='right') if end is not None else len(dates)
+    return slice(lo, hi)
+
+
+def _read_chunks(f: Any, chunk_size: int) -> Any:
+    """
+    Yield chunks of non-blank lines.
+    """
+    while True:
+        lines = list(islice(f, chunk_size))
+        if not lines:
+            return
+        yield [line for line in lines if line.strip()]
+
+
+def _parse_rates(lines: List[str], usecols: List[int]) -> np.ndarray:
+    """
+    Parse the rate columns of a chunk of lines into a (rows x columns) array.
+
+    Uses the C parser of np.loadtxt; only the lines with an empty field
+    (missing fixings) fall back to np.genfromtxt, which reads them as NaN.
+    """
+    try:
+        return np.loadtxt(lines, delimiter=',', usecols=usecols, dtype=np.float64, ndmin=2)
+    except ValueError:
+        missing = np.array([',,' in line or line.rstrip('\r\n').endswith(',') for line in lines])
+        if not missing.any():
+            raise
+    values = np.empty((len(lines), len(usecols)), dtype=np.float64)
+    complete = [line for line, gap in zip(lines, missing) if not gap]
+    if complete:
+        values[~missing] = np.loadtxt(complete, delimiter=',', usecols=usecols, dtype=np.float64, ndmin=2)
+    gaps = np.genfromtxt([line for line, gap in zip(lines, missing) if gap], delimiter=',',
+                         usecols=usecols, dtype=np.float64)
+    values[missing] = gaps.reshape(int(missing.sum()), len(usecols))
+    return values
+
+
+def _load_csv(path: str, tenors: Optional[List[str]], currencies: Optional[List[str]],
+              start: Optional[str], end: Optional[str], chunk_size: int) -> Dict[str, Any]:
+    """
+    Parse a 'date,<CCY>_<TENOR>,...' CSV in chunks of rows, keeping only the selection.
+
+    A first pass reads only the dates to size the (series x dates) output;
+    the second parses the rows inside the window straight into it.
+    Blank lines are skipped and empty fields are read as NaN.
+    """
+    start_date = np.datetime64(start, 'D') if start is not None else None
+    end_date = np.datetime64(end, 'D') if end is not None else None
+
+    with open(path, 'r') as f:
+        header = f.readline().strip().split(',')
+        indices = _select_columns(header[1:], tenors, currencies)
+        usecols = [i + 1 for i in indices]
+
+        date_chunks, masks = [], []
+        for lines in _read_chunks(f, chunk_size):
+            dates = np.array([line.split(',', 1)[0].strip() for line in lines], dtype='datetime64[D]')
+            window = np.ones(len(dates), dtype=bool)
+            if start_date is not None:
+                window &= dates >= start_date
+            if end_date is not None:
+                window &= dates <= end_date
+            date_chunks.append(dates[window])
+            masks.append(window)
+            # Dates are sorted, nothing after the window end can match.
+            if end_date is not None and len(dates) and dates[-1] > end_date:
+                break
+
+        dates = np.concatenate(date_chunks) if date_chunks else np.array([], dtype='datetime64[D]')
+        rates = np.empty((len(usecols), len(dates)), dtype=np.float64)
+
+        f.seek(0)
+        f.readline()
+        position = 0
+        for lines, window in zip(_read_chunks(f, chunk_size), masks):
+            lines = [line for line, keep in zip(lines, window) if keep]
+            if not lines:
+                continue
+            rates[:, position:position + len(lines)] = _parse_rates(lines, usecols).T
+            position += len(lines)
+
+    return {'dates': dates, 'columns': [header[i] for i in usecols], 'rates': rates}
+
+
+def _sidecar_paths(path: str) -> Dict[str, str]:
+    stem = os.path.splitext(path)[0]
+    return {'dates': f"{stem}_dates.npy", 'columns': f"{stem}_columns.npy"}
+
+
+def save_rate_series(path: str, dates: np.ndarray, rates: np.ndarray, columns: List[str]) -> None:
+    """
+    Write rate series to '.npz', or to a memory-mappable '.npy' with dates/columns sidecar files.
+
+    Args:
+        path (str): Target file, '.npz' or '.npy'.
+        dates (np.ndarray): Sorted observation dates.
+        rates (np.ndarray): Rates of shape (series x dates).
+        columns (list): Series names '<CURRENCY>_<TENOR>'.
+    """
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    rates = np.ascontiguousarray(rates, dtype=np.float64)
+    columns = np.asarray(columns, dtype=str)
+    if path.endswith('.npz'):
+        np.savez(path, dates=dates, rates=rates, columns=columns)
+    elif path.endswith('.npy'):
+        sidecars = _sidecar_paths(path)
+        np.save(path, rates)
+        np.save(sidecars['dates'], dates)
+        np.save(sidecars['columns'], columns)
+    else:
+        raise ValueError(f"Unsupported rate series format: {path}")
+
+
+def load_rate_series(path: str, tenors: Optional[List[str]] = None, currencies: Optional[List[str]] = None,
+                     start: Optional[str] = None, end: Optional[str] = None,
+                     chunk_size: int = 100000) -> Dict[str, Any]:
+    """
+    Load historical rate series into contiguous float64 arrays.
+
+    '.npy' files are memory-mapped; a contiguous run of columns and a date
+    window are then views of the file and nothing is read until used.
+    '.npz' files are loaded and '.csv' files are parsed in chunks of rows.
+    Missing fixings (empty CSV fields) are NaN; the calibrators do not skip
+    NaN, so pass series through to_market_data, which drops them.
+
+    Args:
+        path (str): A '.csv', '.npz' or '.npy' file.
+        tenors (list): Tenors to keep, e.g. ['1Y', '10Y']. All if None.
+        currencies (list): Currencies to keep, e.g. ['USD']. All if None.
+        start (str): First date to keep (inclusive), e.g. '2000-01-01'.
+        end (str): Last date to keep (inclusive).
+        chunk_size (int): Rows parsed at a time for CSV files.
+
+    Returns:
+        dict: 'dates', 'columns' and 'rates' of shape (series x dates).
+    """
+    if path.endswith('.csv'):
+        return _load_csv(path, tenors, currencies, start, end, chunk_size)
+
+    if path.endswith('.npz'):
+        with np.load(path) as data:
+            dates, rates, columns = data['dates'], data['rates'], data['columns']
+    elif path.endswith('.npy'):
+        sidecars = _sidecar_paths(path)
+        rates = np.load(path, mmap_mode='r')
+        dates = np.load(sidecars['dates'])
+        columns = np.load(sidecars['columns'])
+    else:
+        raise ValueError(f"Unsupported rate series format: {path}")
+
+    columns = [str(c) for c in columns]
+    indices = _select_columns(columns, tenors, currencies)
+    window = _date_window(dates, start, end)
+    return {
+        'dates': dates[window],
+        'columns': [columns[i] for i in indices],
+        'rates': rates[_index(indices), window],
+    }
+
+
+def to_market_data(series: Dict[str, Any], column: str, dt: float = 1.0) -> Dict[str, Any]:
+    """
+    Market data for the Vasicek/CIR calibrators from one loaded series.
+
+    The series is passed without copying unless it has missing (NaN) fixings;
+    those are dropped, treating the surrounding fixings as one `dt` apart.
+    """
+    rates = series['rates'][series['columns'].index(column)]
+    missing = np.isnan(rates)
+    if missing.any():
+        rates = rates[~missing]
+    return {'rates': rates, 'dt': dt}
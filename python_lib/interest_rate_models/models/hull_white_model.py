@@ -7,13 +7,15 @@ from interest_rate_models.pricing.tree_pricing import tree_pricing
 
 class HullWhiteModel:
     def __init__(self):
-        self.params = {}
+        self.mean_reversion = 0.05
+        self.volatility = 0.015
+        self.drift = 0.0
 
     def calibrate(self, market_data):
         """
         Calibrate the Hull-White model using market data.
         """
-        self.params = hull_white_calibration(market_data)
+        hull_white_calibration(market_data, self)
 
     def price(self, inputs, method='monte_carlo'):
         """
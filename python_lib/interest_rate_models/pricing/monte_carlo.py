@@ -3,37 +3,49 @@
 import numpy as np
 from typing import Dict, Any
 
+def _drift(model: Any, S: np.ndarray) -> np.ndarray:
+    """
+    Drift of the simulated state for the model's dynamics.
+    """
+    if hasattr(model, 'long_term_mean'):
+        # Vasicek / CIR: mean reversion towards the long-term mean
+        return model.mean_reversion * (model.long_term_mean - S)
+    # Ho-Lee / Hull-White / Black-Karasinski: theta (drift, zero if absent) with optional mean reversion
+    return getattr(model, 'drift', 0.0) - getattr(model, 'mean_reversion', 0.0) * S
+
+
 def monte_carlo_pricing(model: Any, inputs: Dict[str, Any], num_paths: int = 10000, antithetic: bool = True) -> float:
     """
     Monte Carlo simulation with Antithetic Sampling for variance reduction.
+
+    `inputs['normals']`, a (paths x steps) array of standard normals, can be
+    passed to reuse the same random numbers across calls; it then also sets
+    the number of paths.
     """
     T = inputs.get('T', 1.0)
     dt = inputs.get('dt', 0.01)
     S0 = inputs.get('S0', 100)
+    normals = inputs.get('normals')
 
     num_steps = int(T / dt)
-    prices = np.zeros(num_paths)
-
-    for i in range(num_paths):
-        path = [S0]
-        path_antithetic = [S0] if antithetic else None
-
-        for _ in range(num_steps):
-            Z = np.random.normal()
-            if antithetic:
-                Z_antithetic = -Z
+    if normals is None:
+        normals = np.random.normal(size=(num_paths, num_steps))
+    elif normals.shape[1] < num_steps:
+        raise ValueError(f"Pricing needs {num_steps} steps but only {normals.shape[1]} normals were given")
 
-            S_new = path[-1] + model.drift * dt + model.volatility * np.sqrt(dt) * Z
-            path.append(S_new)
+    path = np.full(normals.shape[0], S0, dtype=np.float64)
+    path_antithetic = path.copy() if antithetic else None
 
-            if antithetic:
-                S_new_antithetic = path_antithetic[-1] + model.drift * dt + model.volatility * np.sqrt(dt) * Z_antithetic
-                path_antithetic.append(S_new_antithetic)
+    for step in range(num_steps):
+        Z = normals[:, step]
+        path = path + _drift(model, path) * dt + model.volatility * np.sqrt(dt) * Z
 
         if antithetic:
-            prices[i] = 0.5 * (path[-1] + path_antithetic[-1])
-        else:
-            prices[i] = path[-1]
+            path_antithetic = path_antithetic + _drift(model, path_antithetic) * dt - model.volatility * np.sqrt(dt) * Z
 
-    return np.mean(prices)
+    if antithetic:
+        prices = 0.5 * (path + path_antithetic)
+    else:
+        prices = path
 
+    return float(np.mean(prices))
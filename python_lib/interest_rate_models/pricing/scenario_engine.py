@@ -0,0 +1,161 @@
+# Curve-Shock Scenario Engine
+
+import copy
+import numpy as np
+from typing import Dict, Any, List, Optional
+from interest_rate_models.models.ho_lee_model import HoLeeModel
+from interest_rate_models.models.hull_white_model import HullWhiteModel
+from interest_rate_models.models.vasicek_model import VasicekModel
+from interest_rate_models.models.cir_model import CIRModel
+
+# Models whose parameters are fitted to the initial curve only through theta(t).
+CURVE_FITTED_MODELS = (HoLeeModel, HullWhiteModel)
+
+# Models calibrated to a history of short rates ('rates') rather than to the curve.
+SHORT_RATE_MODELS = (VasicekModel, CIRModel)
+
+
+def bucketed_scenarios(time_points: List[float], bump: float = 0.0001) -> List[Dict[str, Any]]:
+    """
+    One key-rate bump scenario per curve node.
+    """
+    return [{'type': 'bucket', 'bucket': i, 'shift': bump} for i in range(len(time_points))]
+
+
+def build_shocked_curves(target_rates: List[float], time_points: List[float],
+                         scenarios: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Build all shocked curves as a single (scenarios x time points) array.
+
+    Supported scenario types:
+        parallel: {'type': 'parallel', 'shift': s}
+        twist:    {'type': 'twist', 'short': s0, 'long': s1}, linear in time between the end points
+        bucket:   {'type': 'bucket', 'bucket': i, 'shift': s}, key-rate bump of node i
+    """
+    rates = np.asarray(target_rates, dtype=np.float64)
+    times = np.asarray(time_points, dtype=np.float64)
+    span = times[-1] - times[0] if len(times) > 1 else 1.0
+    weights = (times - times[0]) / span
+
+    shifts = np.zeros((len(scenarios), len(rates)))
+    for i, scenario in enumerate(scenarios):
+        kind = scenario.get('type')
+        if kind == 'parallel':
+            shifts[i, :] = scenario['shift']
+        elif kind == 'twist':
+            shifts[i, :] = scenario['short'] + (scenario['long'] - scenario['short']) * weights
+        elif kind == 'bucket':
+            bucket = scenario['bucket']
+            if not 0 <= bucket < len(rates):
+                raise ValueError(f"Bucket {bucket} is outside the {len(rates)} curve nodes")
+            shifts[i, bucket] = scenario['shift']
+        else:
+            raise ValueError(f"Invalid scenario type: {kind}")
+
+    return rates[np.newaxis, :] + shifts
+
+
+def generate_normals(num_paths: int, num_steps: int, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Draw the common random numbers shared by every scenario and trade.
+    """
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((num_paths, num_steps))
+
+
+def _theta_shift(model: Any, time_points: np.ndarray, curve_shift: np.ndarray, T: float) -> float:
+    """
+    Change of a curve-fitted model's constant theta over a trade's horizon [0, T].
+
+    The curve nodes are linearly interpolated (flat outside the grid) and
+    d(dF/dt) + a * dF is averaged over [0, T], i.e. weighted by interval length.
+    """
+    if T <= 0:
+        return 0.0
+    grid = np.concatenate(([0.0], time_points[(time_points > 0) & (time_points < T)], [T]))
+    shift = np.interp(grid, time_points, curve_shift)
+    average_shift = np.sum(0.5 * (shift[1:] + shift[:-1]) * np.diff(grid)) / T
+    slope_shift = (shift[-1] - shift[0]) / T
+    return slope_shift + getattr(model, 'mean_reversion', 0.0) * average_shift
+
+
+def _shocked_market_data(model: Any, market_data: Dict[str, Any], curve: np.ndarray,
+                         short_shift: float) -> Dict[str, Any]:
+    """
+    Market data with the shocked curve mapped onto the inputs the model's calibrator reads.
+    """
+    if isinstance(model, SHORT_RATE_MODELS):
+        rates = np.asarray(market_data.get('rates', []), dtype=np.float64)
+        return {**market_data, 'rates': rates + short_shift}
+    return {**market_data, 'target_rates': curve}
+
+
+def run_scenarios(model: Any, market_data: Dict[str, Any], scenarios: List[Dict[str, Any]],
+                  book: List[Dict[str, Any]], num_paths: int = 10000, seed: Optional[int] = None,
+                  curve_fitted: Optional[bool] = None) -> np.ndarray:
+    """
+    Shock the curve, recalibrate and reprice the book for every scenario.
+
+    `model` must already be calibrated to `market_data`; it is left untouched.
+    Each scenario starts from a copy of it, so the calibrators are warm started
+    from the base parameters. Curve-fitted models (Ho-Lee, Hull-White) skip
+    recalibration: theta is moved onto the shocked curve over each trade's
+    horizon. Vasicek and CIR are recalibrated on 'rates' moved by the short-end
+    shock, Ho-Lee (when not treated as curve-fitted) on the shocked
+    'target_rates'; other models raise a ValueError. The base valuation is
+    recalibrated the same way on the unshocked data, so a zero shock gives
+    exactly zero P&L. The starting level 'S0' of every trade moves with the
+    short end. Trades are priced with model.price, sharing one set of normals
+    across all scenarios and trades (common random numbers).
+
+    Args:
+        model: Calibrated base model.
+        market_data (dict): Base market data with 'target_rates' and 'time_points'.
+        scenarios (list): Scenario specifications, see build_shocked_curves.
+        book (list): Trade inputs as passed to model.price, with optional
+            'method' (default 'monte_carlo') and 'quantity' (default 1.0).
+        num_paths (int): Number of Monte Carlo paths.
+        seed (int): Seed for the common random numbers.
+        curve_fitted (bool): Override the curve-fitted model detection.
+
+    Returns:
+        np.ndarray: (scenarios x trades) P&L matrix against the base valuation.
+    """
+    time_points = np.asarray(market_data.get('time_points', []), dtype=np.float64)
+    target_rates = np.asarray(market_data.get('target_rates', []), dtype=np.float64)
+    if len(time_points) == 0 or len(time_points) != len(target_rates):
+        raise ValueError("market_data needs non-empty 'time_points' and 'target_rates' of the same length "
+                         f"to build the shocked curves, got {len(time_points)} and {len(target_rates)}")
+    curves = build_shocked_curves(target_rates, time_points, scenarios)
+    if curve_fitted is None:
+        curve_fitted = isinstance(model, CURVE_FITTED_MODELS)
+    if not curve_fitted and not isinstance(model, SHORT_RATE_MODELS + (HoLeeModel,)):
+        # Black-Karasinski and Hull-White calibrate to vols/swaptions, which curve shocks leave unchanged.
+        raise ValueError(f"{model.__class__.__name__} is not calibrated to the curve and cannot be recalibrated")
+
+    max_steps = max((int(trade.get('T', 1.0) / trade.get('dt', 0.01)) for trade in book), default=0)
+    normals = generate_normals(num_paths, max_steps, seed)
+
+    def value(pricing_model: Any, trade: Dict[str, Any], short_shift: float) -> float:
+        inputs = {**trade, 'S0': trade.get('S0', 100) + short_shift, 'normals': normals}
+        return pricing_model.price(inputs, method=trade.get('method', 'monte_carlo'))
+
+    base = copy.deepcopy(model)
+    if not curve_fitted:
+        base.calibrate(_shocked_market_data(model, market_data, target_rates, 0.0))
+    base_values = np.array([value(base, trade, 0.0) for trade in book])
+
+    pnl = np.empty((len(scenarios), len(book)))
+    for i, curve in enumerate(curves):
+        curve_shift = curve - target_rates
+        short_shift = float(np.interp(0.0, time_points, curve_shift))
+        shocked = copy.deepcopy(model)
+        if not curve_fitted:
+            shocked.calibrate(_shocked_market_data(model, market_data, curve, short_shift))
+
+        for j, trade in enumerate(book):
+            if curve_fitted:
+                shocked.drift = model.drift + _theta_shift(model, time_points, curve_shift, trade.get('T', 1.0))
+            pnl[i, j] = (value(shocked, trade, short_shift) - base_values[j]) * trade.get('quantity', 1.0)
+
+    return pnl
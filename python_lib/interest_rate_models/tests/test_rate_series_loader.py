@@ -0,0 +1,123 @@
+import pytest
+import logging
+import numpy as np
+from interest_rate_models.models.vasicek_model import VasicekModel
+from interest_rate_models.data.rate_series_loader import (
+    load_rate_series, save_rate_series, to_market_data
+)
+
+# Configure logging
+logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def rate_history():
+    logger.info("Setting up mock rate history for testing...")
+    dates = np.arange('2000-01-01', '2001-01-01', dtype='datetime64[D]')
+    columns = ['USD_1Y', 'USD_10Y', 'EUR_1Y', 'EUR_10Y']
+    rng = np.random.default_rng(0)
+    rates = 0.02 + 0.001 * np.cumsum(rng.standard_normal((len(columns), len(dates))), axis=1)
+    return dates, rates, columns
+
+
+@pytest.fixture
+def csv_path(tmp_path, rate_history):
+    dates, rates, columns = rate_history
+    path = tmp_path / 'rates.csv'
+    with open(path, 'w') as f:
+        f.write(','.join(['date'] + columns) + '\n')
+        for i, date in enumerate(dates):
+            f.write(','.join([str(date)] + [str(float(r)) for r in rates[:, i]]) + '\n')
+    return str(path)
+
+
+def test_load_csv_in_chunks(csv_path, rate_history):
+    logger.info("Testing chunked CSV loading...")
+    dates, rates, columns = rate_history
+    series = load_rate_series(csv_path, currencies=['EUR'], start='2000-02-01', end='2000-06-30', chunk_size=50)
+    window = (dates >= np.datetime64('2000-02-01')) & (dates <= np.datetime64('2000-06-30'))
+    assert series['columns'] == ['EUR_1Y', 'EUR_10Y']
+    assert series['rates'].dtype == np.float64
+    assert series['rates'].flags['C_CONTIGUOUS']
+    np.testing.assert_array_equal(series['dates'], dates[window])
+    np.testing.assert_allclose(series['rates'], rates[2:, window])
+
+    with pytest.raises(ValueError):
+        load_rate_series(csv_path, tenors=['30Y'])
+
+
+def test_load_csv_uses_fast_parser(csv_path, rate_history, monkeypatch):
+    logger.info("Testing well-formed CSV files skip the genfromtxt fallback...")
+    def fail(*args, **kwargs):
+        raise AssertionError("genfromtxt fallback used for a well-formed file")
+    monkeypatch.setattr(np, 'genfromtxt', fail)
+    dates, rates, columns = rate_history
+    series = load_rate_series(csv_path, chunk_size=50)
+    np.testing.assert_allclose(series['rates'], rates)
+
+
+def test_load_csv_blank_lines_and_missing_fixings(tmp_path, monkeypatch):
+    logger.info("Testing CSV loading with blank lines and missing fixings...")
+    genfromtxt, fallback_lines = np.genfromtxt, []
+    def spy(lines, *args, **kwargs):
+        fallback_lines.extend(lines)
+        return genfromtxt(lines, *args, **kwargs)
+    monkeypatch.setattr(np, 'genfromtxt', spy)
+    path = tmp_path / 'holidays.csv'
+    path.write_text(
+        'date,USD_1Y,EUR_1Y\n'
+        '2000-01-03,0.01,0.02\n'
+        '\n'
+        '2000-01-04,0.011,\n'
+        '2000-01-05,,0.021\n'
+        '2000-01-06,0.012,0.022\n'
+        '\n'
+    )
+    series = load_rate_series(str(path), chunk_size=2)
+    assert series['rates'].shape == (2, 4)
+    # Only the lines with missing fixings are parsed by the slow fallback.
+    assert fallback_lines == ['2000-01-04,0.011,\n', '2000-01-05,,0.021\n']
+    np.testing.assert_array_equal(series['dates'], np.arange('2000-01-03', '2000-01-07', dtype='datetime64[D]'))
+    np.testing.assert_array_equal(np.isnan(series['rates']), [[False, False, True, False], [False, True, False, False]])
+
+    windowed = load_rate_series(str(path), currencies=['EUR'], start='2000-01-04', end='2000-01-05', chunk_size=2)
+    np.testing.assert_array_equal(windowed['rates'], [[np.nan, 0.021]])
+
+    market_data = to_market_data(series, 'USD_1Y')
+    np.testing.assert_array_equal(market_data['rates'], [0.01, 0.011, 0.012])
+
+    malformed = tmp_path / 'malformed.csv'
+    malformed.write_text('date,USD_1Y,EUR_1Y\n2000-01-03,0.01,\n2000-01-04,abc,0.02\n')
+    with pytest.raises(ValueError):
+        load_rate_series(str(malformed))
+
+
+def test_load_memory_mapped(tmp_path, rate_history):
+    logger.info("Testing memory-mapped loading...")
+    dates, rates, columns = rate_history
+    path = str(tmp_path / 'rates.npy')
+    save_rate_series(path, dates, rates, columns)
+    series = load_rate_series(path, currencies=['USD'], start='2000-03-01')
+    assert isinstance(series['rates'], np.memmap)
+    assert series['columns'] == ['USD_1Y', 'USD_10Y']
+    np.testing.assert_array_equal(series['rates'], rates[:2, dates >= np.datetime64('2000-03-01')])
+
+    npz_path = str(tmp_path / 'rates.npz')
+    save_rate_series(npz_path, dates, rates, columns)
+    npz_series = load_rate_series(npz_path, tenors=['10Y'])
+    assert npz_series['columns'] == ['USD_10Y', 'EUR_10Y']
+    np.testing.assert_array_equal(npz_series['rates'], rates[[1, 3]])
+
+
+def test_calibrate_from_loaded_series(tmp_path, rate_history):
+    logger.info("Testing calibration from a loaded series...")
+    dates, rates, columns = rate_history
+    path = str(tmp_path / 'rates.npy')
+    save_rate_series(path, dates, rates, columns)
+    series = load_rate_series(path)
+    market_data = to_market_data(series, 'EUR_1Y', dt=1/252)
+    assert np.shares_memory(market_data['rates'], series['rates'])
+    model = VasicekModel()
+    model.calibrate(market_data)
+    assert model.volatility > 0
+    logger.info(f"Vasicek calibrated from history: {model.volatility}")
@@ -0,0 +1,127 @@
+import pytest
+import logging
+import numpy as np
+from interest_rate_models.models.ho_lee_model import HoLeeModel
+from interest_rate_models.models.vasicek_model import VasicekModel
+from interest_rate_models.models.hull_white_model import HullWhiteModel
+from interest_rate_models.models.black_karasinski_model import BlackKarasinskiModel
+from interest_rate_models.pricing.scenario_engine import (
+    build_shocked_curves, bucketed_scenarios, run_scenarios
+)
+
+# Configure logging
+logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def mock_market_data():
+    logger.info("Setting up mock market data for testing...")
+    return {
+        'target_rates': [0.015, 0.016, 0.017, 0.018, 0.019, 0.02, 0.022, 0.023, 0.024, 0.025, 0.026, 0.027, 0.028, 0.029],
+        'time_points': [1/365, 2/365, 1/12, 2/12, 3/12, 6/12, 1, 2, 3, 5, 7, 10, 20, 30],
+        'rates': [0.015, 0.016, 0.017, 0.018, 0.019, 0.02, 0.022, 0.023, 0.024, 0.025, 0.026, 0.027, 0.028, 0.029],
+        'dt': 1.0,
+        'target_vols': [0.01] * 14,
+        'target_swaptions': [0.01] * 14
+    }
+
+
+@pytest.fixture
+def book():
+    return [{'S0': 100, 'T': 1.0, 'dt': 0.01}, {'S0': 100, 'T': 2.0, 'dt': 0.01, 'quantity': -2.0}]
+
+
+def test_build_shocked_curves(mock_market_data):
+    logger.info("Testing shocked curve construction...")
+    rates = np.array(mock_market_data['target_rates'])
+    scenarios = [
+        {'type': 'parallel', 'shift': 0.01},
+        {'type': 'twist', 'short': -0.001, 'long': 0.001},
+        {'type': 'bucket', 'bucket': 3, 'shift': 0.0001},
+    ]
+    curves = build_shocked_curves(rates, mock_market_data['time_points'], scenarios)
+    assert curves.shape == (3, len(rates))
+    assert np.allclose(curves[0], rates + 0.01)
+    assert np.isclose(curves[1, 0] - rates[0], -0.001)
+    assert np.isclose(curves[1, -1] - rates[-1], 0.001)
+    assert np.count_nonzero(curves[2] - rates) == 1
+
+    with pytest.raises(ValueError):
+        build_shocked_curves(rates, mock_market_data['time_points'], [{'type': 'butterfly'}])
+    with pytest.raises(ValueError):
+        build_shocked_curves(rates, mock_market_data['time_points'],
+                             [{'type': 'bucket', 'bucket': 14, 'shift': 0.0001}])
+
+
+def test_curve_fitted_scenarios(mock_market_data, book):
+    logger.info("Testing scenario engine for a curve-fitted model...")
+    model = HoLeeModel()
+    bump = 0.0001
+    scenarios = [{'type': 'parallel', 'shift': 0.01}, {'type': 'twist', 'short': -0.01, 'long': 0.01}]
+    scenarios += bucketed_scenarios(mock_market_data['time_points'], bump)
+    pnl = run_scenarios(model, mock_market_data, scenarios, book, num_paths=1000, seed=42)
+    assert pnl.shape == (len(scenarios), len(book))
+    assert np.allclose(pnl[0], [0.01, -0.02])
+    assert pnl[1, 0] < 0 and pnl[1, 1] > 0
+    # Key-rate risk sits on the node at each trade's maturity (1y and 2y).
+    buckets = pnl[2:]
+    expected = np.zeros_like(buckets)
+    expected[6, 0] = bump
+    expected[7, 1] = -2.0 * bump
+    assert np.allclose(buckets, expected)
+    assert model.drift == 0.0
+    logger.info(f"Curve-fitted scenario P&L: {pnl[:2]}")
+
+
+def test_curve_fitted_tree_pricing(mock_market_data):
+    logger.info("Testing scenario engine with tree pricing...")
+    model = HoLeeModel()
+    book = [{'S0': 100, 'K': 100, 'T': 1.0, 'method': 'tree'}]
+    pnl = run_scenarios(model, mock_market_data, [{'type': 'parallel', 'shift': 0.01}], book)
+    assert pnl[0, 0] != 0.0
+
+
+def test_hull_white_scenarios(mock_market_data, book):
+    logger.info("Testing scenario engine for Hull-White...")
+    model = HullWhiteModel()
+    scenarios = [{'type': 'parallel', 'shift': 0.01}, {'type': 'twist', 'short': -0.01, 'long': 0.01}]
+    pnl = run_scenarios(model, mock_market_data, scenarios, book, num_paths=1000, seed=7)
+    assert pnl.shape == (len(scenarios), len(book))
+    assert np.all(pnl != 0.0)
+    assert np.array_equal(pnl, run_scenarios(model, mock_market_data, scenarios, book, num_paths=1000, seed=7))
+    assert model.drift == 0.0
+    logger.info(f"Hull-White scenario P&L: {pnl}")
+
+
+def test_recalibrated_scenarios(mock_market_data, book):
+    logger.info("Testing scenario engine with recalibration...")
+    model = VasicekModel()
+    model.calibrate(mock_market_data)
+    base_params = (model.mean_reversion, model.long_term_mean, model.volatility)
+    scenarios = [{'type': 'parallel', 'shift': 0.01}, {'type': 'twist', 'short': -0.01, 'long': 0.01}]
+    pnl = run_scenarios(model, mock_market_data, scenarios, book, num_paths=1000, seed=42)
+    assert pnl.shape == (len(scenarios), len(book))
+    assert np.all(pnl != 0.0)
+    assert pnl[0, 0] > 0 and pnl[1, 0] < 0
+    assert np.array_equal(pnl, run_scenarios(model, mock_market_data, scenarios, book, num_paths=1000, seed=42))
+    assert (model.mean_reversion, model.long_term_mean, model.volatility) == base_params
+    # Base and scenarios are recalibrated alike, so optimizer drift does not show up as P&L.
+    zero = run_scenarios(model, mock_market_data, [{'type': 'parallel', 'shift': 0.0}], book, num_paths=1000, seed=42)
+    assert np.array_equal(zero, np.zeros((1, len(book))))
+    logger.info(f"Recalibrated scenario P&L: {pnl}")
+
+
+def test_requires_curve_inputs(book):
+    logger.info("Testing scenario engine rejects market data without a curve...")
+    model = VasicekModel()
+    with pytest.raises(ValueError):
+        run_scenarios(model, {'rates': [0.01, 0.02, 0.03], 'dt': 1.0}, [{'type': 'parallel', 'shift': 0.01}], book)
+    with pytest.raises(ValueError):
+        run_scenarios(model, {'time_points': [1, 2], 'target_rates': [0.01], 'rates': [0.01, 0.02]},
+                      [{'type': 'parallel', 'shift': 0.01}], book)
+
+
+def test_recalibration_rejects_uncurved_calibrator(mock_market_data, book):
+    logger.info("Testing scenario engine rejects models not calibrated to the curve...")
+    with pytest.raises(ValueError):
+        run_scenarios(BlackKarasinskiModel(), mock_market_data, [{'type': 'parallel', 'shift': 0.01}], book)